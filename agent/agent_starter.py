@@ -1,23 +1,47 @@
 # agent_starter.py  — clean research agent with explicit seeds/no_search and local fallback
 import argparse
+import asyncio
+import concurrent.futures
+import contextlib
+import functools
+import hashlib
+import inspect
+import json
+import multiprocessing
 import os
 import sys
+import tempfile
+import threading
 from urllib.parse import urlparse
 from pathlib import Path
 
-import requests
+import httpx
+from cachetools import TTLCache
 from dotenv import load_dotenv, find_dotenv
 from duckduckgo_search import DDGS
 try:
     from tavily import TavilyClient
 except Exception:
     TavilyClient = None
+try:
+    import redis
+except Exception:
+    redis = None
+try:
+    import diskcache
+except Exception:
+    diskcache = None
+try:
+    import hyperscan  # Linux-only; summary falls back to `re` without it
+except Exception:
+    hyperscan = None
 
+import fitz  # PyMuPDF
 import trafilatura
-from pypdf import PdfReader
+from resiliparse.extract.html2text import extract_plain_text
 
 # ---- Optional OpenAI; we handle no-credits gracefully
-from openai import OpenAI, RateLimitError, APIConnectionError, APIStatusError, AuthenticationError, BadRequestError
+from openai import OpenAI, AsyncOpenAI, RateLimitError, AuthenticationError
 
 
 # ---------- Env ----------
@@ -28,44 +52,335 @@ def load_env():
     print("OPENAI_API_KEY (masked):", (k[:4] + "..." + k[-4:]) if k else "(missing)")
 
 
+# ---------- Cache (Redis if REDIS_URL, else on-disk) ----------
+_CACHE = None
+_CACHE_READY = False
+_CACHE_LOCK = threading.Lock()
+# Fail fast on a slow/unreachable Redis instead of hanging the caller
+REDIS_TIMEOUT = 0.5
+# Failed fetches / OpenAI fallbacks are worth retrying, so never cache them
+_UNCACHEABLE_PREFIXES = ("[Fetch error", "[OpenAI")
+
+def _get_cache():
+    # Lazy: REDIS_URL may only be set once load_env() has run
+    global _CACHE, _CACHE_READY
+    with _CACHE_LOCK:
+        if not _CACHE_READY:
+            _CACHE_READY = True
+            url = os.getenv("REDIS_URL")
+            if url and redis:
+                try:
+                    _CACHE = redis.Redis.from_url(
+                        url, socket_connect_timeout=REDIS_TIMEOUT, socket_timeout=REDIS_TIMEOUT,
+                    )
+                    _CACHE.ping()
+                except Exception as e:
+                    print(f"[Redis error] {e}", file=sys.stderr)
+                    _CACHE = None
+            if _CACHE is None and diskcache:
+                _CACHE = diskcache.Cache("data/cache")
+    return _CACHE
+
+def _cache_get(key: str):
+    cache = _get_cache()
+    if cache is None: return None
+    try:
+        val = cache.get(key)
+    except Exception as e:
+        print(f"[Cache error] {e}", file=sys.stderr)
+        return None
+    return val.decode("utf-8") if isinstance(val, bytes) else val
+
+def _cache_set(key: str, value: str, ttl: int):
+    cache = _get_cache()
+    if cache is None or not value or value.startswith(_UNCACHEABLE_PREFIXES): return
+    try:
+        if redis and isinstance(cache, redis.Redis):
+            cache.setex(key, ttl, value)
+        else:
+            cache.set(key, value, expire=ttl)
+    except Exception as e:
+        print(f"[Cache error] {e}", file=sys.stderr)
+
+def _sha256(*parts: str) -> str:
+    h = hashlib.sha256()
+    for p in parts:
+        h.update(p.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+def cached(ttl: int, key, name: str | None = None):
+    """Cache a str-returning function (sync or async) under `key(*args, **kwargs)`.
+
+    Functions sharing a `name` share cache entries (e.g. sync/async synthesis).
+    """
+    def deco(fn):
+        prefix = f"agent:{name or fn.__name__}:"
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                # Redis/disk I/O is blocking; keep it off the event loop
+                k = prefix + key(*args, **kwargs)
+                hit = await asyncio.to_thread(_cache_get, k)
+                if hit is not None: return hit
+                out = await fn(*args, **kwargs)
+                await asyncio.to_thread(_cache_set, k, out, ttl)
+                return out
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            k = prefix + key(*args, **kwargs)
+            hit = _cache_get(k)
+            if hit is not None: return hit
+            out = fn(*args, **kwargs)
+            _cache_set(k, out, ttl)
+            return out
+        return wrapper
+    return deco
+
+
+# ---------- HTTP ----------
+HEADERS = {"User-Agent": "Mozilla/5.0"}
+# Retried with exponential backoff (httpx's own `retries` only covers failed connects)
+RETRY_STATUSES = frozenset({502, 503, 504})
+RETRIES = 2
+RETRY_BACKOFF = 0.3
+
+# One pooled keep-alive client shared by every request, so each host costs one TLS
+# handshake. The server opens it for its lifespan; without it each batch gets its own.
+_HTTP_CLIENT = None
+
+def _new_async_client() -> httpx.AsyncClient:
+    transport = httpx.AsyncHTTPTransport(http2=True, limits=httpx.Limits(max_connections=32), retries=RETRIES)
+    return httpx.AsyncClient(transport=transport, headers=HEADERS, follow_redirects=True)
+
+async def start_http_client():
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        _HTTP_CLIENT = _new_async_client()
+
+async def close_http_client():
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is not None:
+        await _HTTP_CLIENT.aclose()
+        _HTTP_CLIENT = None
+
+@contextlib.asynccontextmanager
+async def _http_client():
+    """The shared client when one is open, else a client for this batch only."""
+    if _HTTP_CLIENT is not None:
+        yield _HTTP_CLIENT
+    else:
+        async with _new_async_client() as c:
+            yield c
+
+
 # ---------- Helpers ----------
 def is_pdf_url(url: str) -> bool:
     return urlparse(url).path.lower().endswith(".pdf")
 
-def fetch_text(url: str, timeout=25) -> str:
+# Notes are clipped to a few thousand chars downstream, so don't parse huge PDFs in full.
+PDF_MAX_PAGES = 50
+# PDFs up to this size stay in memory; larger ones are streamed to a temp file
+PDF_SPOOL_LIMIT = 20_000_000
+CHUNK_SIZE = 65536
+# Hard ceiling per download, and the only content types worth extracting
+MAX_DOWNLOAD_BYTES = 25_000_000
+ALLOWED_TYPES = frozenset({"text/html", "text/plain", "application/pdf", "application/xhtml+xml"})
+TOO_LARGE = "[skipped: too large]"
+
+def _is_pdf(url: str, ctype: str) -> bool:
+    return "pdf" in ctype or is_pdf_url(url)
+
+class _PdfSpool:
+    """Collect a streamed PDF in memory, spilling to a temp file past PDF_SPOOL_LIMIT."""
+
+    def __init__(self, size_hint: int = 0):
+        self.buf = bytearray()
+        self.file = None
+        self.size = 0
+        if size_hint > PDF_SPOOL_LIMIT:
+            self._spill()
+
+    def _spill(self):
+        self.file = tempfile.NamedTemporaryFile(suffix=".pdf", delete=False)
+        self.file.write(self.buf)
+        self.buf = bytearray()
+
+    def write(self, chunk: bytes):
+        self.size += len(chunk)
+        if self.file is None and len(self.buf) + len(chunk) > PDF_SPOOL_LIMIT:
+            self._spill()
+        if self.file is not None:
+            self.file.write(chunk)
+        else:
+            self.buf += chunk
+
+    def source(self):
+        """The buffered bytes, or the temp-file path once spilled."""
+        if self.file is None:
+            return self.buf
+        self.file.close()
+        return self.file.name
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if self.file is not None:
+            self.file.close()
+            try: os.unlink(self.file.name)
+            except OSError: pass
+
+def _extract_pdf(src) -> str:
+    doc = fitz.open(src, filetype="pdf") if isinstance(src, str) else fitz.open(stream=src, filetype="pdf")
+    with doc:
+        return "\n".join(page.get_text("text") for page in doc.pages(0, min(PDF_MAX_PAGES, doc.page_count)))
+
+def _extract_html(text: str) -> str:
+    # resiliparse is much faster; trafilatura only when it comes back empty
+    try:
+        extracted = extract_plain_text(text, main_content=True, alt_texts=False, preserve_formatting=False)
+    except Exception:
+        extracted = ""
+    if not extracted.strip():
+        extracted = trafilatura.extract(text, include_comments=False, include_tables=False)
+    return extracted or text[:8000]
+
+def _content_length(headers) -> int:
     try:
-        r = requests.get(url, timeout=timeout, headers={"User-Agent":"Mozilla/5.0"})
-        r.raise_for_status()
-        ctype = (r.headers.get("Content-Type") or "").lower()
-        if "pdf" in ctype or is_pdf_url(url):
-            tmp = Path("tmp_download.pdf")
-            tmp.write_bytes(r.content)
-            try:
-                reader = PdfReader(str(tmp))
-                out = []
-                for p in reader.pages:
-                    out.append(p.extract_text() or "")
-                return "\n".join(out)
-            finally:
-                try: tmp.unlink()
-                except Exception: pass
-        # HTML/text
-        downloaded = trafilatura.fetch_url(url) or r.text
-        extracted = trafilatura.extract(downloaded, include_comments=False, include_tables=False)
-        return extracted or r.text[:8000]
+        return int(headers.get("Content-Length") or 0)
+    except ValueError:
+        return 0
+
+def _precheck(url: str, headers) -> str | None:
+    """Reason to skip a response before reading its body, or None."""
+    mime = (headers.get("Content-Type") or "").split(";")[0].strip().lower()
+    # Servers often label PDFs as octet-stream; trust the .pdf path then
+    if mime and mime not in ALLOWED_TYPES and not (mime == "application/octet-stream" and is_pdf_url(url)):
+        return f"[skipped: unsupported content type {mime}]"
+    if _content_length(headers) > MAX_DOWNLOAD_BYTES:
+        return TOO_LARGE
+    return None
+
+def _decode(raw: bytearray, encoding: str | None) -> str:
+    return raw[:MAX_DOWNLOAD_BYTES].decode(encoding or "utf-8", errors="replace")
+
+def extract_text_from_bytes(content_type: str, raw, url: str = "", encoding: str | None = None) -> str:
+    """Extract text from a downloaded body.
+
+    Top-level (picklable) so it can run in the extraction process pool. For
+    PDFs `raw` may also be the path of a spooled temp file.
+    """
+    if _is_pdf(url, content_type):
+        return _extract_pdf(raw)
+    return _extract_html(_decode(raw, encoding))
+
+# Extraction (PyMuPDF/resiliparse) is CPU-bound; run it on all cores, off the GIL.
+# The server starts the pool in its lifespan; the CLI creates it on first use.
+_EXTRACT_POOL = None
+
+def start_extract_pool() -> concurrent.futures.ProcessPoolExecutor:
+    global _EXTRACT_POOL
+    if _EXTRACT_POOL is None:
+        # Never fork: by now the process may have worker threads (anyio, to_thread)
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        _EXTRACT_POOL = concurrent.futures.ProcessPoolExecutor(
+            max_workers=os.cpu_count(), mp_context=multiprocessing.get_context(method),
+        )
+    return _EXTRACT_POOL
+
+def shutdown_extract_pool():
+    global _EXTRACT_POOL
+    if _EXTRACT_POOL is not None:
+        _EXTRACT_POOL.shutdown(cancel_futures=True)
+        _EXTRACT_POOL = None
+
+async def _extract_in_pool(*args) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(start_extract_pool(), extract_text_from_bytes, *args)
+
+async def _read_response(r: httpx.Response, url: str) -> str:
+    r.raise_for_status()
+    skip = _precheck(url, r.headers)
+    if skip:
+        return skip
+    ctype = (r.headers.get("Content-Type") or "").lower()
+    if _is_pdf(url, ctype):
+        with _PdfSpool(_content_length(r.headers)) as spool:
+            async for chunk in r.aiter_bytes(CHUNK_SIZE):
+                spool.write(chunk)
+                if spool.size > MAX_DOWNLOAD_BYTES:
+                    return TOO_LARGE
+            return await _extract_in_pool(ctype, spool.source(), url)
+    raw = bytearray()
+    async for chunk in r.aiter_bytes(CHUNK_SIZE):
+        raw += chunk
+        if len(raw) > MAX_DOWNLOAD_BYTES:
+            break  # extract from what we have
+    return await _extract_in_pool(ctype, raw, url, r.encoding)
+
+@cached(ttl=86400, key=lambda client, url, timeout=25: _sha256(url))
+async def fetch_text_async(client: httpx.AsyncClient, url: str, timeout=25) -> str:
+    try:
+        for attempt in range(RETRIES + 1):
+            async with client.stream("GET", url, timeout=timeout) as r:
+                if r.status_code in RETRY_STATUSES and attempt < RETRIES:
+                    await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+                    continue
+                return await _read_response(r, url)
     except Exception as e:
         return f"[Fetch error for {url}: {e}]"
 
+async def fetch_all_async(urls: list[str], timeout=25) -> list[str]:
+    """Fetch every URL concurrently; order of results matches `urls`."""
+    async with _http_client() as c:
+        texts = await asyncio.gather(*[fetch_text_async(c, u, timeout) for u in urls], return_exceptions=True)
+    return [t if isinstance(t, str) else f"[Fetch error for {u}: {t}]" for u, t in zip(urls, texts)]
+
+async def iter_fetch_async(urls: list[str]):
+    """Fetch every URL concurrently, yielding (url, text) as each one finishes."""
+    async def one(c, u):
+        try:
+            return u, await fetch_text_async(c, u)
+        except Exception as e:
+            return u, f"[Fetch error for {u}: {e}]"
+
+    async with _http_client() as c:
+        for fut in asyncio.as_completed([one(c, u) for u in urls]):
+            yield await fut
+
+def fetch_text(url: str, timeout=25) -> str:
+    """Sync wrapper around fetch_all_async for the CLI."""
+    return asyncio.run(fetch_all_async([url], timeout=timeout))[0]
+
 def dedupe_urls(items):
+    pairs = tuple((it.get("title",""), it.get("href") or it.get("url")) for it in items)
+    return [{"title": t, "href": h} for t, h in _dedupe_pairs(pairs)]
+
+@functools.lru_cache(maxsize=4096)
+def _norm_url(u: str) -> str:
+    """Dedup key: drop query/fragment, lowercase the host, strip a trailing slash."""
+    p = urlparse(u)
+    return f"{p.scheme}://{p.netloc.lower()}{p.path.rstrip('/')}"
+
+@functools.lru_cache(maxsize=1024)
+def _dedupe_pairs(pairs: tuple) -> tuple:
     seen, out = set(), []
-    for it in items:
-        u = it.get("href") or it.get("url")
+    for title, u in pairs:
         if not u: continue
-        key = urlparse(u)._replace(query="", fragment="").geturl()
+        key = _norm_url(u)
         if key in seen: continue
         seen.add(key)
-        out.append({"title": it.get("title",""), "href": key})
-    return out
+        # The key is only for matching; fetch/cite the URL as given, minus query/fragment
+        out.append((title, urlparse(u)._replace(query="", fragment="").geturl()))
+    return tuple(out)
+
+# In-process layer in front of the shared cache: local TTL -> Redis/disk -> network
+SEARCH_TTL = 600
+_SEARCH_CACHE = TTLCache(maxsize=512, ttl=SEARCH_TTL)
+_SEARCH_LOCK = threading.Lock()
 
 def search_web(query: str, max_results=5):
     """
@@ -73,7 +388,29 @@ def search_web(query: str, max_results=5):
       1) Tavily (if TAVILY_API_KEY present)
       2) DuckDuckGo 'lite' backend with small count to avoid rate-limit
     NO hidden PFAS fallback.
+
+    Non-empty results are cached for SEARCH_TTL seconds per (query, max_results).
     """
+    key = (query, max_results)
+    with _SEARCH_LOCK:
+        hit = _SEARCH_CACHE.get(key)
+    if hit is not None:
+        return list(hit)
+
+    shared_key = f"agent:search_web:{_sha256(query, str(max_results))}"
+    shared = _cache_get(shared_key)
+    if shared is not None:
+        results = json.loads(shared)
+    else:
+        results = _search_web_uncached(query, max_results)
+        if results:
+            _cache_set(shared_key, json.dumps(results), SEARCH_TTL)
+    if results:
+        with _SEARCH_LOCK:
+            _SEARCH_CACHE[key] = results
+    return list(results)
+
+def _search_web_uncached(query: str, max_results: int):
     results = []
 
     tv_key = os.getenv("TAVILY_API_KEY")
@@ -104,55 +441,210 @@ def search_web(query: str, max_results=5):
 
 # ---------- Local (no-API) summary ----------
 import re
+
+import numpy as np
+
+_SENT_RE = re.compile(r'(?<=[.!?])\s+')
+_WORD_RE = re.compile(r"\b\w+\b")
+KEYWORDS = frozenset({
+    'pfas','pfoa','pfos','limit','standard','guideline','gac','ion',
+    'exchange','ebct','ro','cost','treatment','drinking','water',
+    'regulation','epa','who','eu','uk','compare','costs','design','table'
+})
+# One alternation instead of a per-word set lookup; \b keeps "ro"/"ion" whole-word
+_KW_RE = re.compile(r"\b(?:" + "|".join(map(re.escape, sorted(KEYWORDS))) + r")\b")
+
+MAX_SUMMARY_SENTENCES = 400
+
+def _build_keyword_db():
+    """Hyperscan database matching every keyword (whole-word, caseless) in one pass.
+
+    Its word boundaries and case folding are ASCII-only (Hyperscan rejects \\b
+    in UCP mode), so callers only use it for ASCII notes. A compile failure is
+    a bug, not a missing optional dependency, so it raises instead of quietly
+    disabling the fast path.
+    """
+    if hyperscan is None: return None
+    kws = sorted(KEYWORDS)
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[rb"\b" + re.escape(kw).encode() + rb"\b" for kw in kws],
+        ids=list(range(len(kws))),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_UTF8] * len(kws),
+    )
+    return db
+
+_KW_DB = _build_keyword_db()
+
+def _keyword_counts_hs(notes: str, n: int) -> np.ndarray:
+    """Keyword hits for each of the first `n` sentences of _SENT_RE.split(notes)."""
+    # Byte offset where each sentence starts (one extra marks the end of sentence n-1)
+    starts, pos, prev = [0], 0, 0
+    for m in _SENT_RE.finditer(notes):
+        if len(starts) > n: break
+        pos += len(notes[prev:m.end()].encode("utf-8"))
+        prev = m.end()
+        starts.append(pos)
+    data = notes.encode("utf-8")
+    if len(starts) > n:
+        data = data[:starts[n]]
+
+    ends = []
+    def on_match(id_, frm, to, flags, context):
+        ends.append(to)
+    _KW_DB.scan(data, match_event_handler=on_match)
+    if not ends:
+        return np.zeros(n, dtype=np.int64)
+    # A match's last byte (to - 1) falls in the sentence whose start precedes it
+    which = np.searchsorted(np.asarray(starts), np.asarray(ends) - 1, side="right") - 1
+    return np.bincount(which, minlength=max(n, len(starts)))[:n]
+
 def local_extractive_summary(notes: str, max_sentences: int = 7) -> str:
     if not notes: return "(no content)"
-    sentences = re.split(r'(?<=[.!?])\s+', notes)
-    keywords = {
-        'pfas','pfoa','pfos','limit','standard','guideline','gac','ion',
-        'exchange','ebct','ro','cost','treatment','drinking','water',
-        'regulation','epa','who','eu','uk','compare','costs','design','table'
-    }
-    scored=[]
-    for i, s in enumerate(sentences[:400]):
-        words = re.findall(r"\b\w+\b", s.lower())
-        if not words: continue
-        kw = sum(1 for w in words if w in keywords)
-        score = kw + min(len(s)/120.0, 1.5) + (1.0 if i < 5 else 0.0)
-        scored.append((score, i, s.strip()))
-    if not scored:
+    sentences = _SENT_RE.split(notes)
+    n = min(len(sentences), MAX_SUMMARY_SENTENCES)
+    idx = np.fromiter((i for i, s in enumerate(sentences[:n]) if _WORD_RE.search(s)), dtype=np.int64)
+    if not idx.size:
         return sentences[0][:400] if sentences else "(no content)"
-    top = sorted(scored, key=lambda x: x[0], reverse=True)[:max_sentences]
-    top = [t[2] for t in sorted(top, key=lambda x: x[1])]
-    return "• " + "\n• ".join(top)
+    sents = [sentences[i] for i in idx]
+    # Non-ASCII text needs Unicode word boundaries (e.g. no "ro" hit in "éro"): use `re`
+    if _KW_DB is not None and notes.isascii():
+        kw = _keyword_counts_hs(notes, n)[idx].astype(np.float32)
+    else:
+        kw = np.fromiter((len(_KW_RE.findall(s.lower())) for s in sents), dtype=np.float32, count=len(sents))
+    lengths = np.fromiter((len(s) for s in sents), dtype=np.float32, count=len(sents))
+    scores = kw + np.minimum(lengths / 120.0, 1.5) + (idx < 5)
+    k = min(max_sentences, scores.size)
+    top = np.argpartition(-scores, k - 1)[:k] if k < scores.size else np.arange(scores.size)
+    top.sort()  # back to document order
+    return "• " + "\n• ".join(sents[j].strip() for j in top)
+
+
+# ---------- Notes de-duplication ----------
+from collections import Counter
+
+_SOURCE_RE = re.compile(r"^# (https?://\S+)$", re.M)
+# Whitespace runs and leftover wiki "[edit]" markers, cleaned in one pass
+_NOISE_RE = re.compile(r"\s*\[edit\]\s*|\s+")
+SHINGLE = 5
+
+def _clean_notes(text: str) -> str:
+    return _NOISE_RE.sub(" ", text).strip()
+
+def dedupe_notes(notes: str, threshold: float = 0.8) -> str:
+    """Drop sentences repeated across sources (exact, or >= `threshold` 5-gram Jaccard)."""
+    parts = _SOURCE_RE.split(notes)  # [preamble, url1, body1, url2, body2, ...]
+    seen = set()
+    kept_shingles = []   # shingle set per kept sentence
+    index = {}           # shingle -> ids of kept sentences containing it
+    out = [_clean_notes(parts[0])] if parts[0].strip() else []
+    for n in range(1, len(parts), 2):
+        url, body = parts[n], parts[n + 1]
+        kept = []
+        for sent in _SENT_RE.split(_clean_notes(body)):
+            words = _WORD_RE.findall(sent.lower())
+            if not words: continue
+            digest = hashlib.blake2b(" ".join(words).encode("utf-8"), digest_size=8).digest()
+            if digest in seen: continue
+            seen.add(digest)
+            shingles = {tuple(words[i:i + SHINGLE]) for i in range(max(1, len(words) - SHINGLE + 1))}
+            overlap = Counter(j for sh in shingles for j in index.get(sh, ()))
+            if any(inter / (len(shingles) + len(kept_shingles[j]) - inter) >= threshold
+                   for j, inter in overlap.items()):
+                continue
+            for sh in shingles:
+                index.setdefault(sh, []).append(len(kept_shingles))
+            kept_shingles.append(shingles)
+            kept.append(sent)
+        out.append(f"# {url}\n{' '.join(kept)}")
+    return "\n\n".join(out)
 
 
 # ---------- OpenAI wrapper (safe) ----------
-def synthesize_with_openai(prompt: str, notes: str, sources: list, model: str = "gpt-4o-mini"):
-    client = OpenAI(timeout=30, max_retries=2)
+SYNTHESIS_TTL = 3600
+
+def _synthesis_key(prompt: str, notes: str, sources: list, model: str = "gpt-4o-mini") -> str:
+    return _sha256(model, prompt, *sorted(s["href"] for s in sources), notes)
+
+def _synthesis_messages(prompt: str, notes: str, sources: list) -> list[dict]:
     src_block = "\n".join(f"- {s['href']}" for s in sources)
     sys_msg = (
         "You are a concise research assistant. Answer ONLY the user query using NOTES. "
         "Cite the provided URLs inline. Prefer recent, credible sources. Be specific."
     )
-    user_msg = f"USER QUERY:\n{prompt}\n\nNOTES:\n{notes}\n\nSOURCES:\n{src_block}"
+    user_msg = f"USER QUERY:\n{prompt}\n\nNOTES:\n{dedupe_notes(notes)}\n\nSOURCES:\n{src_block}"
+    return [
+        {"role":"system","content":sys_msg},
+        {"role":"user","content":user_msg}
+    ]
+
+def _synthesis_fallback(e: Exception, notes: str) -> str:
+    if isinstance(e, (AuthenticationError, RateLimitError)):
+        # wrong/missing key OR no credits -> local summary
+        return f"[OpenAI auth/quota]\n{e}\n\nLocal summary:\n{local_extractive_summary(notes)}"
+    # network/API issue -> local summary
+    return f"[OpenAI error]\n{e}\n\nLocal summary:\n{local_extractive_summary(notes)}"
+
+# Shared clients keep their connection pool (and TLS session to api.openai.com) warm.
+# Built lazily so OPENAI_API_KEY can come from load_env() after import.
+@functools.lru_cache(maxsize=None)
+def _openai_client() -> OpenAI:
+    return OpenAI(timeout=30, max_retries=2)
+
+@functools.lru_cache(maxsize=None)
+def _async_openai_client() -> AsyncOpenAI:
+    # Bound to the event loop that first uses it, i.e. the server's loop
+    return AsyncOpenAI(timeout=30, max_retries=2)
 
+@cached(ttl=SYNTHESIS_TTL, key=_synthesis_key)
+def synthesize_with_openai(prompt: str, notes: str, sources: list, model: str = "gpt-4o-mini"):
     try:
-        resp = client.chat.completions.create(
+        resp = _openai_client().chat.completions.create(
             model=model,
-            messages=[
-                {"role":"system","content":sys_msg},
-                {"role":"user","content":user_msg}
-            ],
+            messages=_synthesis_messages(prompt, notes, sources),
             temperature=0.2,
         )
         return resp.choices[0].message.content
+    except Exception as e:
+        return _synthesis_fallback(e, notes)
 
-    except (AuthenticationError, RateLimitError) as e:
-        # wrong/missing key OR no credits -> local summary
-        return f"[OpenAI auth/quota]\n{e}\n\nLocal summary:\n{local_extractive_summary(notes)}"
-    except (APIConnectionError, APIStatusError, BadRequestError, Exception) as e:
-        # network/API issue -> local summary
-        return f"[OpenAI error]\n{e}\n\nLocal summary:\n{local_extractive_summary(notes)}"
+@cached(ttl=SYNTHESIS_TTL, key=_synthesis_key, name="synthesize_with_openai")
+async def synthesize_with_openai_async(prompt: str, notes: str, sources: list, model: str = "gpt-4o-mini"):
+    try:
+        resp = await _async_openai_client().chat.completions.create(
+            model=model,
+            messages=_synthesis_messages(prompt, notes, sources),
+            temperature=0.2,
+        )
+        return resp.choices[0].message.content
+    except Exception as e:
+        return _synthesis_fallback(e, notes)
+
+async def synthesize_with_openai_stream(prompt: str, notes: str, sources: list, model: str = "gpt-4o-mini"):
+    """Like synthesize_with_openai_async, but yields the answer as it is generated."""
+    key = f"agent:synthesize_with_openai:{_synthesis_key(prompt, notes, sources, model)}"
+    hit = await asyncio.to_thread(_cache_get, key)
+    if hit is not None:
+        yield hit
+        return
+
+    parts = []
+    try:
+        stream = await _async_openai_client().chat.completions.create(
+            model=model,
+            messages=_synthesis_messages(prompt, notes, sources),
+            temperature=0.2,
+            stream=True,
+        )
+        async for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                parts.append(delta)
+                yield delta
+    except Exception as e:
+        yield ("\n\n" if parts else "") + _synthesis_fallback(e, notes)
+        return
+    await asyncio.to_thread(_cache_set, key, "".join(parts), SYNTHESIS_TTL)
 
 
 def clip(s: str, n=4000) -> str:
@@ -186,10 +678,8 @@ def minimal_research_agent(query: str,
         print(f"  {i}. {h['href']}")
 
     # 2) Fetch & build notes
-    chunks = []
-    for h in hits:
-        txt = fetch_text(h["href"])
-        chunks.append(f"# {h['href']}\n{clip(txt, n=4000)}")
+    texts = asyncio.run(fetch_all_async([h["href"] for h in hits]))
+    chunks = [f"# {h['href']}\n{clip(txt, n=4000)}" for h, txt in zip(hits, texts)]
     combined = "\n\n".join(chunks)
 
     # 3) Synthesize
@@ -1,25 +1,42 @@
+import matplotlib
+matplotlib.use("Agg")  # headless: skip GUI backend detection
 import matplotlib.pyplot as plt
-from pfas_db import get_monthly_data
-import pandas as pd
+from pfas_db import get_monthly_aggregates, DB_PATH
+import glob
 import os
 
 os.makedirs("data", exist_ok=True)
 
+def db_version():
+    """Latest mtime of the DB and its WAL file (WAL writes don't touch the main file)."""
+    paths = (DB_PATH, DB_PATH + "-wal")
+    return max((os.stat(p).st_mtime_ns for p in paths if os.path.exists(p)), default=0)
+
 def plot_monthly_trends(month=None, year=None):
     """Generate monthly trend chart."""
-    rows = get_monthly_data(month, year)
+    # Reuse the PNG until the DB changes: one stat() instead of a query + plot
+    prefix = f"data/monthly_trends_{year or 'all'}_{month or 'all'}_"
+    chart_path = f"{prefix}{db_version()}.png"
+    if os.path.exists(chart_path):
+        return chart_path
+
+    # Average removal per product, aggregated in SQLite
+    rows = get_monthly_aggregates(month, year)
     if not rows:
         return "No data available"
 
-    df = pd.DataFrame(rows, columns=['date','product','removal','price'])
-    df['date'] = pd.to_datetime(df['date'])
-
-    # Average removal per product
-    avg_removal = df.groupby('product')['removal'].mean()
-    avg_removal.plot(kind='bar', title='Monthly PFAS Removal %')
-    plt.ylabel('Removal %')
-    plt.tight_layout()
-    chart_path = 'data/monthly_trends.png'
-    plt.savefig(chart_path)
-    plt.close()
+    products = [r[0] for r in rows]
+    avg_removal = [r[1] for r in rows]
+    fig, ax = plt.subplots(figsize=(8, 5))
+    ax.bar(products, avg_removal)
+    ax.set_title('Monthly PFAS Removal %')
+    ax.set_xlabel('product')
+    ax.set_ylabel('Removal %')
+    ax.tick_params(axis='x', labelrotation=90)
+    fig.tight_layout()
+    fig.savefig(chart_path, dpi=100)
+    plt.close(fig)
+    for old in glob.glob(prefix + "*.png"):
+        if old != chart_path:
+            os.remove(old)
     return chart_path
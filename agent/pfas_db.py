@@ -6,9 +6,22 @@ import os
 os.makedirs("data", exist_ok=True)
 DB_PATH = "data/pfas_data.db"
 
+INSERT_PFAS_SQL = """
+    INSERT INTO PFAS_Data (date, product_name, removal_percentage, tender_price)
+    VALUES (?, ?, ?, ?)
+"""
+
+def _connect():
+    """Open the DB with synchronous=NORMAL (per-connection; safe under WAL, fewer fsyncs)."""
+    conn = sqlite3.connect(DB_PATH)
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
 def init_db():
     """Initialize the SQLite database."""
-    conn = sqlite3.connect(DB_PATH)
+    conn = _connect()
+    # journal_mode=WAL is persisted in the DB file, so setting it once here is enough
+    conn.execute("PRAGMA journal_mode=WAL")
     cursor = conn.cursor()
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS PFAS_Data (
@@ -19,30 +32,59 @@ def init_db():
             tender_price REAL
         )
     ''')
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_pfas_date ON PFAS_Data(date)")
     conn.commit()
     conn.close()
 
 def insert_pfas_data(data):
     """Insert PFAS data into database."""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
     today = datetime.today().strftime('%Y-%m-%d')
-    for d in data:
-        cursor.execute('''
-            INSERT INTO PFAS_Data (date, product_name, removal_percentage, tender_price)
-            VALUES (?, ?, ?, ?)
-        ''', (today, d['product'], d['removal_percentage'], d['tender_price']))
-    conn.commit()
-    conn.close()
+    rows = [(today, d['product'], d['removal_percentage'], d['tender_price']) for d in data]
+    conn = _connect()
+    try:
+        with conn:  # single transaction, committed on success
+            conn.executemany(INSERT_PFAS_SQL, rows)
+    finally:
+        conn.close()
+
+def month_bounds(month, year):
+    """Return [start, end) ISO dates covering the given month."""
+    start = f"{int(year):04d}-{int(month):02d}-01"
+    if int(month) == 12:
+        end = f"{int(year) + 1:04d}-01-01"
+    else:
+        end = f"{int(year):04d}-{int(month) + 1:02d}-01"
+    return start, end
 
 def get_monthly_data(month=None, year=None):
     """Retrieve monthly PFAS data."""
-    conn = sqlite3.connect(DB_PATH)
+    conn = _connect()
     cursor = conn.cursor()
     query = "SELECT date, product_name, removal_percentage, tender_price FROM PFAS_Data"
+    params = ()
+    if month and year:
+        # Range on the raw YYYY-MM-DD column so idx_pfas_date can be used
+        query += " WHERE date >= ? AND date < ?"
+        params = month_bounds(month, year)
+    cursor.execute(query, params)
+    rows = cursor.fetchall()
+    conn.close()
+    return rows
+
+def get_monthly_aggregates(month=None, year=None):
+    """Per-product averages for the month: (product, avg_removal, avg_price, count)."""
+    conn = _connect()
+    cursor = conn.cursor()
+    query = """
+        SELECT product_name, AVG(removal_percentage), AVG(tender_price), COUNT(*)
+        FROM PFAS_Data
+    """
+    params = ()
     if month and year:
-        query += f" WHERE strftime('%Y', date)='{year}' AND strftime('%m', date)='{month:02d}'"
-    cursor.execute(query)
+        query += " WHERE date >= ? AND date < ?"
+        params = month_bounds(month, year)
+    query += " GROUP BY product_name ORDER BY product_name"
+    cursor.execute(query, params)
     rows = cursor.fetchall()
     conn.close()
     return rows
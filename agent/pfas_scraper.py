@@ -1,25 +1,38 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from selectolax.parser import HTMLParser
+from urllib3.util.retry import Retry
+
+# Pooled keep-alive session reused across scrapes
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": "Mozilla/5.0"})
+_adapter = HTTPAdapter(
+    pool_connections=32, pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+)
+_SESSION.mount("http://", _adapter)
+_SESSION.mount("https://", _adapter)
 
 def fetch_pfas_data():
     """Scrape PFAS data from Haycarb website."""
     url = "https://www.haycarb.com/activated-carbon-solutions/water/drinking-water-treatment/pfas-removal/"
-    response = requests.get(url)
-    soup = BeautifulSoup(response.text, 'html.parser')
+    response = _SESSION.get(url, timeout=20)
+    response.raise_for_status()
+    tree = HTMLParser(response.text)
 
     data = []
 
     # Adjust selector according to the actual HTML table
-    table = soup.find('table')
+    table = tree.css_first('table')
     if table:
-        rows = table.find_all('tr')
+        rows = table.css('tr')
         for row in rows[1:]:  # Skip header
-            cols = row.find_all('td')
+            cols = row.css('td')
             if len(cols) >= 3:
-                product = cols[0].text.strip()
-                removal = float(cols[1].text.strip().replace('%',''))
+                product = cols[0].text().strip()
+                removal = float(cols[1].text().strip().replace('%',''))
                 try:
-                    price = float(cols[2].text.strip().replace('$',''))
+                    price = float(cols[2].text().strip().replace('$',''))
                 except:
                     price = 0.0
                 data.append({
@@ -1,26 +1,39 @@
 import os
+import json
 import asyncio
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import List
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 from dotenv import load_dotenv
 
 from agent.agent_starter import (
     search_web,
-    fetch_text,
-    synthesize_with_openai,
+    iter_fetch_async,
+    synthesize_with_openai_stream,
     clip,
     local_extractive_summary,
+    start_http_client,
+    close_http_client,
+    start_extract_pool,
+    shutdown_extract_pool,
 )
 
 from aiolimiter import AsyncLimiter
 from tavily import TavilyClient
 
+try:
+    # Brotli (~15% smaller JS than gzip); falls back to gzip for clients without br
+    from brotli_asgi import BrotliMiddleware as Compressor
+except ImportError:
+    Compressor = GZipMiddleware
+
 # Load environment variables
 load_dotenv(override=True)
 
@@ -28,7 +41,19 @@ BASE_DIR = Path(__file__).resolve().parent
 DIST_DIR = BASE_DIR / "web" / "dist"
 
 # --- FastAPI App ---
-app = FastAPI(title="Research Agent API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One pooled HTTP client for every /api/run, so connections stay warm
+    await start_http_client()
+    # Start extraction workers before any request spins up worker threads
+    start_extract_pool()
+    try:
+        yield
+    finally:
+        await close_http_client()
+        shutdown_extract_pool()
+
+app = FastAPI(title="Research Agent API", lifespan=lifespan)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -37,6 +62,22 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+class CompressStatic:
+    """Compress frontend responses; /api/ is left alone so the SSE stream isn't buffered."""
+
+    def __init__(self, app, minimum_size: int = 1024):
+        self.app = app
+        self.compressed = Compressor(app, minimum_size=minimum_size)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith("/api/"):
+            await self.app(scope, receive, send)
+        else:
+            await self.compressed(scope, receive, send)
+
+app.add_middleware(CompressStatic, minimum_size=1024)
+
 # --- Models ---
 class RunRequest(BaseModel):
     query: str
@@ -75,11 +116,23 @@ def search_with_tavily(query: str, max_results: int = 3):
         return []
 
 
+# --- SSE helpers ---
+def sse(event: str, data) -> str:
+    """Format one Server-Sent Event; data is JSON-encoded so newlines are safe."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+def sse_answer(answer: str, sources: List[str]):
+    """Whole answer as a single token frame plus the closing done frame."""
+    yield sse("token", answer)
+    yield sse("done", RunResponse(answer=answer, sources=sources).model_dump())
+
+
 # --- API Route ---
-@app.post("/api/run", response_model=RunResponse)
-async def run_agent(req: RunRequest):
+async def run_agent_events(req: RunRequest):
     if req.demo_mode or os.getenv("DEMO_LOCK_OUTPUT") == "1":
-        return RunResponse(answer="Demo mode output", sources=["https://example.com"])
+        for frame in sse_answer("Demo mode output", ["https://example.com"]):
+            yield frame
+        return
 
     # Step 1: Try DuckDuckGo
     try:
@@ -93,28 +146,54 @@ async def run_agent(req: RunRequest):
         hits = search_with_tavily(req.query, max_results=req.max_results)
 
     if not hits:
-        return RunResponse(answer="No search results (rate-limited or failed)", sources=[])
+        for frame in sse_answer("No search results (rate-limited or failed)", []):
+            yield frame
+        return
 
-    # Step 3: Fetch content from URLs
-    chunks = []
-    for h in hits:
-        try:
-            txt = fetch_text(h["href"])
-        except Exception as e:
-            txt = f"(fetch error for {h['href']}: {e})"
-        chunks.append(f"# {h['href']}\n{clip(txt, n=4000)}")
+    # Step 3: Fetch content from URLs (concurrently), reporting each as it lands
+    texts = {}
+    async for url, txt in iter_fetch_async([h["href"] for h in hits]):
+        texts[url] = txt
+        yield sse("source", {"url": url, "preview": clip(txt, n=300)})
+    chunks = [f"# {h['href']}\n{clip(texts[h['href']], n=4000)}" for h in hits]
 
     combined = "\n\n".join(chunks)
+    sources = [h["href"] for h in hits]
 
     # Step 4: Summarize
     if req.force_local:
-        answer = local_extractive_summary(combined, max_sentences=8)
-    else:
-        answer = synthesize_with_openai(req.query, combined, hits)
+        for frame in sse_answer(local_extractive_summary(combined, max_sentences=8), sources):
+            yield frame
+        return
+
+    parts = []
+    async for delta in synthesize_with_openai_stream(req.query, combined, hits):
+        parts.append(delta)
+        yield sse("token", delta)
+    yield sse("done", RunResponse(answer="".join(parts), sources=sources).model_dump())
 
-    return RunResponse(answer=answer, sources=[h["href"] for h in hits])
+
+@app.post("/api/run")
+async def run_agent(req: RunRequest):
+    """Stream the run as SSE: `source` per fetched URL, `token` per answer delta, then `done`."""
+    return StreamingResponse(
+        run_agent_events(req),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 # --- Serve React frontend ---
+class SPAStaticFiles(StaticFiles):
+    """Vite's /assets/* are content-hashed, so cache them forever; revalidate everything else."""
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        resp = super().file_response(full_path, stat_result, scope, status_code)
+        if scope["path"].startswith("/assets/"):
+            resp.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        else:
+            resp.headers["Cache-Control"] = "no-cache"
+        return resp
+
 if DIST_DIR.exists():
-    app.mount("/", StaticFiles(directory=str(DIST_DIR), html=True), name="spa")
+    app.mount("/", SPAStaticFiles(directory=str(DIST_DIR), html=True), name="spa")
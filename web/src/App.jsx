@@ -4,10 +4,11 @@ import "./App.css";
 // Backend API URL
 const API_BASE = import.meta.env.VITE_API_BASE || "http://localhost:8000";
 
-async function runAgent({ query, noSearch, maxResults, demoMode }) {
+// Reads the /api/run SSE stream: `source` per fetched URL, `token` per answer delta, then `done`.
+async function runAgent({ query, noSearch, maxResults, demoMode }, { onSource, onToken } = {}) {
   const res = await fetch(`${API_BASE}/api/run`, {
     method: "POST",
-    headers: { "Content-Type": "application/json" },
+    headers: { "Content-Type": "application/json", Accept: "text/event-stream" },
     body: JSON.stringify({
       query,
       no_search: noSearch,
@@ -18,7 +19,35 @@ async function runAgent({ query, noSearch, maxResults, demoMode }) {
     }),
   });
   if (!res.ok) throw new Error(`HTTP ${res.status}`);
-  return await res.json();
+
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+  let result = null;
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    let sep;
+    while ((sep = buffer.indexOf("\n\n")) !== -1) {
+      const frame = buffer.slice(0, sep);
+      buffer = buffer.slice(sep + 2);
+      let event = "message";
+      let data = "";
+      for (const line of frame.split("\n")) {
+        if (line.startsWith("event: ")) event = line.slice(7);
+        else if (line.startsWith("data: ")) data += line.slice(6);
+      }
+      if (!data) continue;
+      const payload = JSON.parse(data);
+      if (event === "source") onSource?.(payload);
+      else if (event === "token") onToken?.(payload);
+      else if (event === "done") result = payload;
+    }
+  }
+  // No `done` frame means the server failed or the connection dropped mid-stream
+  if (!result) throw new Error("Stream ended before the analysis finished");
+  return result;
 }
 
 function safeUrlParts(raw) {
@@ -69,10 +98,19 @@ export default function App() {
     setSources([]);
 
     try {
-      const data = await runAgent({ query, noSearch, maxResults, demoMode });
+      const data = await runAgent(
+        { query, noSearch, maxResults, demoMode },
+        {
+          onSource: ({ url }) => {
+            setSources((prev) => [...prev, url]);
+            setStatus(`Fetched ${url}`);
+          },
+          onToken: (delta) => setAnswer((prev) => prev + delta),
+        }
+      );
       if (data.error) setErrorMsg(String(data.error));
-      setAnswer(data.answer || "No answer received");
-      setSources(Array.isArray(data.sources) ? data.sources : []);
+      setAnswer((prev) => data.answer || prev || "No answer received");
+      if (Array.isArray(data.sources)) setSources(data.sources);
       setStatus("Analysis complete");
       setTimeout(() => setStatus(""), 2500);
     } catch (e) {
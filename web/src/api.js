@@ -1,8 +1,10 @@
-// Thin client for your FastAPI endpoint
-export async function runAgent({ query, noSearch = false, maxResults = 3 }) {
+// Thin client for your FastAPI endpoint.
+// /api/run streams Server-Sent Events: `source` ({ url, preview }) per fetched URL,
+// `token` (string) per answer delta, then `done` ({ answer, sources }).
+export async function runAgent({ query, noSearch = false, maxResults = 3 }, { onSource, onToken } = {}) {
   const resp = await fetch('/api/run', {
     method: 'POST',
-    headers: { 'Content-Type': 'application/json' },
+    headers: { 'Content-Type': 'application/json', Accept: 'text/event-stream' },
     body: JSON.stringify({
       query,
       no_search: noSearch,
@@ -13,5 +15,33 @@ export async function runAgent({ query, noSearch = false, maxResults = 3 }) {
     const text = await resp.text().catch(() => '')
     throw new Error(`API ${resp.status}: ${text || 'request failed'}`)
   }
-  return resp.json() // { answer, sources: string[] }
+
+  const reader = resp.body.getReader()
+  const decoder = new TextDecoder()
+  let buffer = ''
+  let result = null
+  for (;;) {
+    const { value, done } = await reader.read()
+    if (done) break
+    buffer += decoder.decode(value, { stream: true })
+    let sep
+    while ((sep = buffer.indexOf('\n\n')) !== -1) {
+      const frame = buffer.slice(0, sep)
+      buffer = buffer.slice(sep + 2)
+      let event = 'message'
+      let data = ''
+      for (const line of frame.split('\n')) {
+        if (line.startsWith('event: ')) event = line.slice(7)
+        else if (line.startsWith('data: ')) data += line.slice(6)
+      }
+      if (!data) continue
+      const payload = JSON.parse(data)
+      if (event === 'source') onSource?.(payload)
+      else if (event === 'token') onToken?.(payload)
+      else if (event === 'done') result = payload
+    }
+  }
+  // No `done` frame means the server failed or the connection dropped mid-stream
+  if (!result) throw new Error('Stream ended before the analysis finished')
+  return result // { answer, sources: string[] }
 }